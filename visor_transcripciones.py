@@ -5,113 +5,43 @@ Genera una página HTML portable que muestra pares imagen/texto
 con navegación entre páginas.
 """
 
+import argparse
+import collections
+import contextlib
+import io
+import itertools
+import json
+import mmap
 import os
+import shutil
 import sys
-import base64
-import html
-import glob
-from pathlib import Path
+import time
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
 
+# pybase64 usa instrucciones SIMD y es varias veces más rápido; si no está
+# instalado se recurre al módulo estándar, que tiene la misma API
+try:
+    import pybase64
+except ImportError:
+    import base64 as pybase64
 
-def obtener_carpeta(mensaje):
-    """Solicita una carpeta al usuario y valida que exista."""
-    while True:
-        carpeta = input(mensaje).strip()
-        # Eliminar comillas si el usuario arrastra la carpeta al terminal
-        carpeta = carpeta.strip("'\"")
-        # Interpretar barras invertidas de escape del shell (e.g. carpeta\ con\ espacios)
-        carpeta = carpeta.replace("\\ ", " ")
-        if os.path.isdir(carpeta):
-            return carpeta
-        print(f"  Error: '{carpeta}' no es una carpeta válida. Inténtalo de nuevo.")
 
-
-def imagen_a_base64(ruta_imagen):
-    """Convierte una imagen JPG a una cadena base64."""
-    with open(ruta_imagen, "rb") as f:
-        datos = f.read()
-    return base64.b64encode(datos).decode("utf-8")
-
-
-def leer_texto(ruta_txt):
-    """Lee un archivo de texto probando varias codificaciones."""
-    for enc in ("utf-8", "latin-1", "cp1252"):
-        try:
-            with open(ruta_txt, "r", encoding=enc) as f:
-                return f.read()
-        except (UnicodeDecodeError, UnicodeError):
-            continue
-    # Último recurso
-    with open(ruta_txt, "r", encoding="utf-8", errors="replace") as f:
-        return f.read()
-
-
-def emparejar_archivos(carpeta_img, carpeta_txt):
-    """Empareja JPGs con TXTs por nombre base."""
-    # Recoger imágenes (jpg y jpeg, case-insensitive)
-    imagenes = {}
-    for ext in ("*.jpg", "*.JPG", "*.jpeg", "*.JPEG"):
-        for ruta in glob.glob(os.path.join(carpeta_img, ext)):
-            nombre_base = Path(ruta).stem.lower()
-            imagenes[nombre_base] = ruta
-
-    # Recoger textos
-    textos = {}
-    for ext in ("*.txt", "*.TXT"):
-        for ruta in glob.glob(os.path.join(carpeta_txt, ext)):
-            nombre_base = Path(ruta).stem.lower()
-            textos[nombre_base] = ruta
-
-    # Emparejar
-    nombres_comunes = sorted(set(imagenes.keys()) & set(textos.keys()))
-    pares = []
-    for nombre in nombres_comunes:
-        pares.append({
-            "nombre": Path(imagenes[nombre]).stem,
-            "ruta_img": imagenes[nombre],
-            "ruta_txt": textos[nombre],
-        })
-
-    return pares
-
-
-def generar_html(pares, ruta_salida):
-    """Genera el archivo HTML autocontenido."""
-    print(f"\nGenerando HTML con {len(pares)} páginas...")
-
-    # Preparar datos de cada página
-    paginas_js = []
-    for i, par in enumerate(pares):
-        print(f"  Procesando {i+1}/{len(pares)}: {par['nombre']}", end="\r")
-        b64 = imagen_a_base64(par["ruta_img"])
-        texto = leer_texto(par["ruta_txt"])
-        texto_escaped = html.escape(texto)
-        # Escapar para insertar en JS
-        texto_js = texto_escaped.replace("\\", "\\\\").replace("`", "\\`").replace("$", "\\$")
-        paginas_js.append(
-            f'  {{\n'
-            f'    nombre: `{html.escape(par["nombre"])}`,\n'
-            f'    imagen: "data:image/jpeg;base64,{b64}",\n'
-            f'    texto: `{texto_js}`\n'
-            f'  }}'
-        )
-
-    paginas_str = ",\n".join(paginas_js)
-    print()
-
-    html_contenido = f'''<!DOCTYPE html>
+# Plantilla HTML, partida en el punto donde se insertan los datos de las páginas
+# y ya codificada para escribirse tal cual en el fichero binario de salida
+HTML_CABECERA = '''<!DOCTYPE html>
 <html lang="es">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width, initial-scale=1.0">
 <title>Visor de Transcripciones</title>
 <style>
-  * {{
+  * {
     margin: 0;
     padding: 0;
     box-sizing: border-box;
-  }}
-  body {{
+  }
+  body {
     font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
     background: #1a1a2e;
     color: #e0e0e0;
@@ -119,9 +49,9 @@ def generar_html(pares, ruta_salida):
     display: flex;
     flex-direction: column;
     overflow: hidden;
-  }}
+  }
   /* Barra superior */
-  .toolbar {{
+  .toolbar {
     display: flex;
     align-items: center;
     justify-content: space-between;
@@ -130,18 +60,18 @@ def generar_html(pares, ruta_salida):
     border-bottom: 1px solid #0f3460;
     flex-shrink: 0;
     min-height: 50px;
-  }}
-  .toolbar h1 {{
+  }
+  .toolbar h1 {
     font-size: 16px;
     font-weight: 600;
     color: #e94560;
-  }}
-  .nav-controls {{
+  }
+  .nav-controls {
     display: flex;
     align-items: center;
     gap: 10px;
-  }}
-  .nav-btn {{
+  }
+  .nav-btn {
     background: #0f3460;
     color: #e0e0e0;
     border: 1px solid #533483;
@@ -150,36 +80,36 @@ def generar_html(pares, ruta_salida):
     cursor: pointer;
     font-size: 14px;
     transition: background 0.2s;
-  }}
-  .nav-btn:hover:not(:disabled) {{
+  }
+  .nav-btn:hover:not(:disabled) {
     background: #533483;
-  }}
-  .nav-btn:disabled {{
+  }
+  .nav-btn:disabled {
     opacity: 0.4;
     cursor: default;
-  }}
-  .page-info {{
+  }
+  .page-info {
     font-size: 14px;
     color: #a0a0b0;
     min-width: 120px;
     text-align: center;
-  }}
-  .page-name {{
+  }
+  .page-name {
     font-size: 13px;
     color: #e94560;
     max-width: 300px;
     overflow: hidden;
     text-overflow: ellipsis;
     white-space: nowrap;
-  }}
+  }
   /* Contenido principal */
-  .viewer {{
+  .viewer {
     display: flex;
     flex: 1;
     overflow: hidden;
-  }}
+  }
   /* Panel imagen */
-  .panel-imagen {{
+  .panel-imagen {
     flex: 1;
     display: flex;
     align-items: center;
@@ -188,27 +118,27 @@ def generar_html(pares, ruta_salida):
     background: #0d0d1a;
     padding: 10px;
     position: relative;
-  }}
-  .panel-imagen img {{
+  }
+  .panel-imagen img {
     max-width: 100%;
     max-height: 100%;
     object-fit: contain;
     border-radius: 4px;
     box-shadow: 0 4px 20px rgba(0,0,0,0.5);
-  }}
+  }
   /* Separador arrastrable */
-  .divider {{
+  .divider {
     width: 6px;
     background: #0f3460;
     cursor: col-resize;
     flex-shrink: 0;
     transition: background 0.2s;
-  }}
-  .divider:hover, .divider.active {{
+  }
+  .divider:hover, .divider.active {
     background: #e94560;
-  }}
+  }
   /* Panel texto */
-  .panel-texto {{
+  .panel-texto {
     flex: 1;
     overflow-y: auto;
     padding: 20px 24px;
@@ -219,9 +149,9 @@ def generar_html(pares, ruta_salida):
     white-space: pre-wrap;
     word-wrap: break-word;
     color: #d0d0e0;
-  }}
+  }
   /* Barra inferior */
-  .statusbar {{
+  .statusbar {
     display: flex;
     align-items: center;
     justify-content: space-between;
@@ -231,23 +161,23 @@ def generar_html(pares, ruta_salida):
     font-size: 12px;
     color: #707090;
     flex-shrink: 0;
-  }}
+  }
   /* Selector de página */
-  .page-select {{
+  .page-select {
     background: #0f3460;
     color: #e0e0e0;
     border: 1px solid #533483;
     padding: 4px 8px;
     border-radius: 4px;
     font-size: 13px;
-  }}
+  }
   /* Zoom */
-  .zoom-controls {{
+  .zoom-controls {
     display: flex;
     align-items: center;
     gap: 6px;
-  }}
-  .zoom-btn {{
+  }
+  .zoom-btn {
     background: #0f3460;
     color: #e0e0e0;
     border: 1px solid #533483;
@@ -260,43 +190,43 @@ def generar_html(pares, ruta_salida):
     align-items: center;
     justify-content: center;
     transition: background 0.2s;
-  }}
-  .zoom-btn:hover {{
+  }
+  .zoom-btn:hover {
     background: #533483;
-  }}
-  .zoom-level {{
+  }
+  .zoom-level {
     font-size: 12px;
     color: #a0a0b0;
     min-width: 40px;
     text-align: center;
-  }}
+  }
   /* Atajos teclado */
-  .shortcuts {{
+  .shortcuts {
     font-size: 11px;
     color: #505070;
-  }}
-  .shortcuts kbd {{
+  }
+  .shortcuts kbd {
     background: #0f3460;
     padding: 1px 5px;
     border-radius: 3px;
     border: 1px solid #533483;
     font-size: 11px;
-  }}
+  }
   /* Responsive */
-  @media (max-width: 768px) {{
-    .viewer {{
+  @media (max-width: 768px) {
+    .viewer {
       flex-direction: column;
-    }}
-    .divider {{
+    }
+    .divider {
       width: 100%;
       height: 6px;
       cursor: row-resize;
-    }}
-    .panel-imagen, .panel-texto {{
+    }
+    .panel-imagen, .panel-texto {
       flex: none;
       height: 50%;
-    }}
-  }}
+    }
+  }
 </style>
 </head>
 <body>
@@ -314,7 +244,7 @@ def generar_html(pares, ruta_salida):
 
 <div class="viewer">
   <div class="panel-imagen" id="panelImg">
-    <img id="visorImg" src="" alt="Imagen escaneada">
+    <img id="visorImg" src="" alt="Imagen escaneada" decoding="async">
   </div>
   <div class="divider" id="divider"></div>
   <div class="panel-texto" id="panelTxt"></div>
@@ -334,31 +264,60 @@ def generar_html(pares, ruta_salida):
   <span id="totalInfo"></span>
 </div>
 
+<script type="application/json" id="datos">
+[
+'''.encode("utf-8")
+
+HTML_PIE = '''
+]
+</script>
 <script>
-const paginas = [
-{paginas_str}
-];
+const paginas = JSON.parse(document.getElementById("datos").textContent);
 
 let paginaActual = 0;
 let zoom = 100;
 
 // Inicializar selector
 const sel = document.getElementById("pageSelect");
-paginas.forEach((p, i) => {{
+paginas.forEach((p, i) => {
   const opt = document.createElement("option");
   opt.value = i;
   opt.textContent = p.nombre;
   sel.appendChild(opt);
-}});
+});
 
 document.getElementById("totalInfo").textContent = paginas.length + " páginas";
 
-function irPagina(n) {{
+// Caché de imágenes ya decodificadas de la página actual y sus vecinas
+const cacheImagenes = new Map();
+const enReposo = window.requestIdleCallback || (f => setTimeout(f, 0));
+
+function obtenerImagen(n) {
+  let img = cacheImagenes.get(n);
+  if (!img) {
+    img = new Image();
+    img.src = paginas[n].imagen;
+    cacheImagenes.set(n, img);
+  }
+  return img;
+}
+
+function precargarVecinas(n) {
+  // Liberar las que quedan lejos para no retener todo el volumen en memoria
+  for (const k of cacheImagenes.keys()) {
+    if (Math.abs(k - n) > 1) cacheImagenes.delete(k);
+  }
+  if (n + 1 < paginas.length) obtenerImagen(n + 1);
+  if (n > 0) obtenerImagen(n - 1);
+}
+
+function irPagina(n) {
   if (n < 0 || n >= paginas.length) return;
   paginaActual = n;
   const p = paginas[n];
-  document.getElementById("visorImg").src = p.imagen;
-  document.getElementById("panelTxt").innerHTML = p.texto;
+  document.getElementById("visorImg").src = obtenerImagen(n).src;
+  enReposo(() => precargarVecinas(paginaActual));
+  document.getElementById("panelTxt").textContent = p.texto;
   document.getElementById("pageInfo").textContent = (n + 1) + " / " + paginas.length;
   document.getElementById("pageName").textContent = p.nombre;
   document.getElementById("btnPrev").disabled = (n === 0);
@@ -366,19 +325,19 @@ function irPagina(n) {{
   sel.value = n;
   // Reset scroll del texto al cambiar de página
   document.getElementById("panelTxt").scrollTop = 0;
-}}
+}
 
-function cambiarZoom(delta) {{
+function cambiarZoom(delta) {
   zoom = Math.max(20, Math.min(300, zoom + delta));
   document.getElementById("visorImg").style.maxWidth = zoom + "%";
   document.getElementById("visorImg").style.maxHeight = zoom + "%";
   document.getElementById("zoomLevel").textContent = zoom + "%";
-}}
+}
 
 // Atajos de teclado
-document.addEventListener("keydown", function(e) {{
+document.addEventListener("keydown", function(e) {
   if (e.target.tagName === "SELECT" || e.target.tagName === "INPUT") return;
-  switch(e.key) {{
+  switch(e.key) {
     case "ArrowLeft":
       irPagina(paginaActual - 1);
       e.preventDefault();
@@ -396,59 +355,251 @@ document.addEventListener("keydown", function(e) {{
       break;
     case "f":
     case "F":
-      if (!document.fullscreenElement) {{
+      if (!document.fullscreenElement) {
         document.documentElement.requestFullscreen();
-      }} else {{
+      } else {
         document.exitFullscreen();
-      }}
+      }
       break;
-  }}
-}});
+  }
+});
 
 // Divisor arrastrable
-(function() {{
+(function() {
   const divider = document.getElementById("divider");
   const panelImg = document.getElementById("panelImg");
   const panelTxt = document.getElementById("panelTxt");
   let arrastrando = false;
 
-  divider.addEventListener("mousedown", function(e) {{
+  divider.addEventListener("mousedown", function(e) {
     arrastrando = true;
     divider.classList.add("active");
     e.preventDefault();
-  }});
+  });
 
-  document.addEventListener("mousemove", function(e) {{
+  document.addEventListener("mousemove", function(e) {
     if (!arrastrando) return;
     const viewer = document.querySelector(".viewer");
     const rect = viewer.getBoundingClientRect();
     const porcentaje = ((e.clientX - rect.left) / rect.width) * 100;
-    if (porcentaje > 15 && porcentaje < 85) {{
+    if (porcentaje > 15 && porcentaje < 85) {
       panelImg.style.flex = "none";
       panelImg.style.width = porcentaje + "%";
       panelTxt.style.flex = "none";
       panelTxt.style.width = (100 - porcentaje) + "%";
-    }}
-  }});
+    }
+  });
 
-  document.addEventListener("mouseup", function() {{
-    if (arrastrando) {{
+  document.addEventListener("mouseup", function() {
+    if (arrastrando) {
       arrastrando = false;
       divider.classList.remove("active");
-    }}
-  }});
-}})();
+    }
+  });
+})();
 
 // Mostrar primera página
-if (paginas.length > 0) {{
+if (paginas.length > 0) {
   irPagina(0);
-}}
+}
 </script>
 </body>
-</html>'''
+</html>'''.encode("utf-8")
 
-    with open(ruta_salida, "w", encoding="utf-8") as f:
-        f.write(html_contenido)
+
+def obtener_carpeta(mensaje):
+    """Solicita una carpeta al usuario y valida que exista."""
+    while True:
+        carpeta = input(mensaje).strip()
+        # Eliminar comillas si el usuario arrastra la carpeta al terminal
+        carpeta = carpeta.strip("'\"")
+        # Interpretar barras invertidas de escape del shell (e.g. carpeta\ con\ espacios)
+        carpeta = carpeta.replace("\\ ", " ")
+        if os.path.isdir(carpeta):
+            return carpeta
+        print(f"  Error: '{carpeta}' no es una carpeta válida. Inténtalo de nuevo.")
+
+
+# Por debajo de este número de páginas no compensa arrancar procesos hijos
+MIN_PAGINAS_PARALELO = 16
+
+# Tamaño de bloque múltiplo de 3 para que no aparezca relleno '=' a mitad del flujo
+BLOQUE_BASE64 = 57 * 4096
+
+
+def escribir_base64(ruta_imagen, salida):
+    """Escribe una imagen JPG codificada en base64 en un fichero binario abierto."""
+    with open(ruta_imagen, "rb") as f:
+        # mmap no admite archivos vacíos
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        # Se codifican porciones de la proyección en memoria, sin copiar
+        # los bytes de la imagen a objetos intermedios
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as vista:
+            for inicio in range(0, len(vista), BLOQUE_BASE64):
+                salida.write(pybase64.b64encode(vista[inicio:inicio + BLOQUE_BASE64]))
+
+
+def leer_texto(ruta_txt):
+    """Lee un archivo de texto en UTF-8 o, si no lo es, en cp1252."""
+    with open(ruta_txt, "rb") as f:
+        datos = f.read()
+    try:
+        texto = datos.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        # Se decodifican los mismos bytes ya leídos, sin reabrir el archivo
+        texto = datos.decode("cp1252", errors="replace")
+    # Normalizar saltos de línea como hacía la lectura en modo texto
+    return texto.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def a_json(cadena):
+    """Codifica una cadena como literal JSON apto para un bloque <script>."""
+    # Dentro de <script> solo hay que evitar que aparezca "</script>" o "<!--"
+    return json.dumps(cadena, ensure_ascii=False).replace("<", "\\u003c")
+
+
+def escribir_pagina(par, salida, url_imagen=None):
+    """Escribe el registro JSON de una página en un fichero binario abierto.
+
+    Si se indica url_imagen, la imagen se referencia por esa URL en lugar de
+    incrustarse en base64.
+    """
+    texto = leer_texto(par["ruta_txt"])
+    # Cada fragmento se escribe por separado para no concatenar cadenas
+    salida.write(b'  {\n    "nombre": ')
+    salida.write(a_json(par["nombre"]).encode("utf-8"))
+    if url_imagen is None:
+        salida.write(b',\n    "imagen": "data:image/jpeg;base64,')
+        escribir_base64(par["ruta_img"], salida)
+        salida.write(b'"')
+    else:
+        salida.write(b',\n    "imagen": ')
+        salida.write(a_json(url_imagen).encode("utf-8"))
+    salida.write(b',\n    "texto": ')
+    salida.write(a_json(texto).encode("utf-8"))
+    salida.write(b'\n  }')
+
+
+def copiar_imagen(par, carpeta_imagenes):
+    """Copia la imagen de una página a carpeta_imagenes y devuelve su URL relativa al HTML.
+
+    Si carpeta_imagenes es None la imagen se incrusta y se devuelve None.
+    """
+    if carpeta_imagenes is None:
+        return None
+    nombre_img = os.path.basename(par["ruta_img"])
+    shutil.copyfile(par["ruta_img"], os.path.join(carpeta_imagenes, nombre_img))
+    return urllib.parse.quote(f"{os.path.basename(carpeta_imagenes)}/{nombre_img}")
+
+
+def codificar_pagina(par, carpeta_imagenes=None):
+    """Devuelve el registro JSON de una página como bytes (usado por los procesos hijos)."""
+    buffer = io.BytesIO()
+    escribir_pagina(par, buffer, copiar_imagen(par, carpeta_imagenes))
+    return buffer.getvalue()
+
+
+def codificar_en_paralelo(ex, pares, carpeta_imagenes, ventana):
+    """Genera en orden los registros de las páginas, con como mucho `ventana` en curso.
+
+    Cada registro completo viaja del proceso hijo al padre, así que la
+    ventana limita cuántos se acumulan en memoria esperando a ser escritos.
+    """
+    restantes = iter(pares)
+    pendientes = collections.deque(
+        ex.submit(codificar_pagina, par, carpeta_imagenes)
+        for par in itertools.islice(restantes, ventana)
+    )
+    while pendientes:
+        registro = pendientes.popleft().result()
+        for par in itertools.islice(restantes, 1):
+            pendientes.append(ex.submit(codificar_pagina, par, carpeta_imagenes))
+        yield registro
+
+
+def emparejar_archivos(carpeta_img, carpeta_txt):
+    """Empareja JPGs con TXTs por nombre base."""
+    # Recoger imágenes (jpg y jpeg, case-insensitive) en una sola pasada,
+    # guardando el nombre base original junto a la ruta. Como hacía glob, se
+    # omiten los archivos ocultos (p. ej. los "._*" que crea macOS en
+    # volúmenes FAT, exFAT o SMB)
+    imagenes = {}
+    with os.scandir(carpeta_img) as it:
+        for e in it:
+            nombre = e.name
+            if nombre.startswith("."):
+                continue
+            if nombre.lower().endswith((".jpg", ".jpeg")) and e.is_file():
+                nombre_base = nombre[:nombre.rfind(".")]
+                imagenes[nombre_base.lower()] = (nombre_base, e.path)
+
+    # Recoger textos
+    textos = {}
+    with os.scandir(carpeta_txt) as it:
+        for e in it:
+            nombre = e.name
+            if nombre.startswith("."):
+                continue
+            if nombre.lower().endswith(".txt") and e.is_file():
+                textos[nombre[:nombre.rfind(".")].lower()] = e.path
+
+    # Emparejar
+    nombres_comunes = sorted(imagenes.keys() & textos.keys())
+    pares = []
+    for nombre in nombres_comunes:
+        nombre_base, ruta_img = imagenes[nombre]
+        pares.append({
+            "nombre": nombre_base,
+            "ruta_img": ruta_img,
+            "ruta_txt": textos[nombre],
+        })
+
+    return pares
+
+
+def generar_html(pares, ruta_salida, imagenes_externas=False):
+    """Genera el archivo HTML autocontenido.
+
+    Con imagenes_externas, las imágenes se copian a una carpeta junto al HTML
+    (<nombre>_imagenes) en lugar de incrustarse en base64.
+    """
+    total = len(pares)
+    print(f"\nGenerando HTML con {total} páginas...")
+
+    carpeta_imagenes = None
+    if imagenes_externas:
+        carpeta_imagenes = os.path.splitext(ruta_salida)[0] + "_imagenes"
+        os.makedirs(carpeta_imagenes, exist_ok=True)
+
+    # Con varios núcleos y suficientes páginas, se codifican en procesos hijos
+    # a cambio de pasar cada registro completo por IPC. Si no, cada página se
+    # escribe directamente en el fichero sin copias intermedias.
+    nucleos = os.cpu_count() or 1
+    paralelo = nucleos > 1 and total >= MIN_PAGINAS_PARALELO
+    with open(ruta_salida, "wb") as f, \
+            (ProcessPoolExecutor() if paralelo else contextlib.nullcontext()) as ex:
+        registros = None
+        if paralelo:
+            registros = codificar_en_paralelo(ex, pares, carpeta_imagenes, 2 * nucleos)
+        f.write(HTML_CABECERA)
+        # El progreso solo se muestra en terminal y como mucho cada 0,1 s
+        mostrar_progreso = sys.stdout.isatty()
+        ultimo = 0.0
+        for i, par in enumerate(pares):
+            if mostrar_progreso:
+                ahora = time.monotonic()
+                if ahora - ultimo > 0.1 or i == total - 1:
+                    print(f"  Procesando {i+1}/{total}: {par['nombre']}", end="\r")
+                    ultimo = ahora
+            if i > 0:
+                f.write(b",\n")
+            if registros is None:
+                escribir_pagina(par, f, copiar_imagen(par, carpeta_imagenes))
+            else:
+                f.write(next(registros))
+        f.write(HTML_PIE)
+    print()
 
     tamano = os.path.getsize(ruta_salida)
     if tamano > 1024 * 1024:
@@ -457,11 +608,21 @@ if (paginas.length > 0) {{
         tamano_str = f"{tamano / 1024:.1f} KB"
 
     print(f"\n  Archivo generado: {ruta_salida}")
+    if carpeta_imagenes is not None:
+        print(f"  Imágenes copiadas en: {carpeta_imagenes}")
     print(f"  Tamaño: {tamano_str}")
-    print(f"  Páginas: {len(pares)}")
+    print(f"  Páginas: {total}")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Genera un visor HTML de pares imagen/texto.")
+    parser.add_argument(
+        "--imagenes-externas",
+        action="store_true",
+        help="copiar las imágenes a una carpeta junto al HTML en lugar de incrustarlas en base64",
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("  VISOR DE TRANSCRIPCIONES")
     print("  Generador de HTML autocontenido")
@@ -493,8 +654,11 @@ def main():
         nombre_salida += ".html"
 
     ruta_salida = os.path.join(os.getcwd(), nombre_salida)
-    generar_html(pares, ruta_salida)
-    print("\n  Listo. Abre el archivo en cualquier navegador.")
+    generar_html(pares, ruta_salida, args.imagenes_externas)
+    if args.imagenes_externas:
+        print("\n  Listo. Abre el archivo en cualquier navegador (junto a su carpeta de imágenes).")
+    else:
+        print("\n  Listo. Abre el archivo en cualquier navegador.")
 
 
 if __name__ == "__main__":